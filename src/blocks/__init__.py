@@ -1,11 +1,13 @@
 """Internally exposed API for extracting rich, raw blocks from Playwright."""
 
-from src.blocks.core import extract_raw_blocks
+from src.blocks.core import extract_raw_blocks, extract_raw_blocks_many, browser_pool
 from src.blocks.models import BlockArray, Block, TextBlock
 from src.common.models import BBox, Span, bbox_size
 
 __all__ = [
     "extract_raw_blocks",
+    "extract_raw_blocks_many",
+    "browser_pool",
     "BlockArray",
     "Block",
     "TextBlock",
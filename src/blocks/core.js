@@ -1,6 +1,14 @@
+// Flatten a DOMRect into an (x0, y0, x1, y1) array so Python can use it as a BBox as-is
+function toBBox(rect) {
+    return [rect.x, rect.y, rect.x + rect.width, rect.y + rect.height];
+}
+
+
 // Helper function to extract spans with style information
 function extractSpans(element) {
     const spans = [];
+    // Sibling text nodes share a parent, so resolve each parent's style once
+    const styleCache = new Map();
     const walker = document.createTreeWalker(
         element,
         NodeFilter.SHOW_TEXT,
@@ -14,7 +22,11 @@ function extractSpans(element) {
         if (!text) continue;
 
         const parent = node.parentElement;
-        const style = getComputedStyle(parent);
+        let style = styleCache.get(parent);
+        if (!style) {
+            style = getComputedStyle(parent);
+            styleCache.set(parent, style);
+        }
         const fontWeight = parseFloat(style.fontWeight);
         const fontSize = parseFloat(style.fontSize);
         const fontFamily = style.fontFamily;
@@ -34,76 +46,112 @@ function extractSpans(element) {
             ancestor = ancestor.parentElement;
         }
 
-        spans.push({
-            text: text,
-            formats: (() => {
-                const fmts = new Set();
-                if (bold) fmts.add("bold");
-                if (italic) fmts.add("italic");
-                if (code) fmts.add("code");
-                return fmts;
-            })(),
-            font_size: fontSize,
-            font_weight: fontWeight,
-            font_family: fontFamily
-        });
+        const formats = [];
+        if (bold) formats.push("bold");
+        if (italic) formats.push("italic");
+        if (code) formats.push("code");
+
+        // Positional [text, formats, font_size, font_weight, font_family]; keys would repeat per span
+        spans.push([text, formats, fontSize, fontWeight, fontFamily]);
     }
 
     return spans;
 }
 
 
-function extractTextNodes(selectors) {
-    const SKIP_TAGS = new Set([
-        'SCRIPT','STYLE','NOSCRIPT','IFRAME','SVG','CANVAS',
-        'VIDEO','AUDIO','OBJECT','EMBED','META','LINK',
-        'BUTTON','INPUT','SELECT','TEXTAREA','LABEL',
-        'NAV','FOOTER','ASIDE','MENU','MENUITEM',
-        'FORM','FIELDSET','OPTION','DATALIST',
-        'DIALOG','SUMMARY','TEMPLATE','SLOT',
-        'IMG','PICTURE','SOURCE','TRACK',
-        'PROGRESS','METER','OUTPUT'
-    ]);
-
-    const NAV_ROLES = new Set([
-        'navigation','banner','contentinfo','complementary',
-        'search','form','menu','menubar','toolbar',
-        'tab','tablist','tabpanel','dialog','alertdialog',
-        'status','log','marquee','timer','tooltip'
-    ]);
+// Element classification tables, built once per page rather than on every extractTextNodes() call
+const SKIP_TAGS = new Set([
+    'SCRIPT','STYLE','NOSCRIPT','IFRAME','SVG','CANVAS',
+    'VIDEO','AUDIO','OBJECT','EMBED','META','LINK',
+    'BUTTON','INPUT','SELECT','TEXTAREA','LABEL',
+    'NAV','FOOTER','ASIDE','MENU','MENUITEM',
+    'FORM','FIELDSET','OPTION','DATALIST',
+    'DIALOG','SUMMARY','TEMPLATE','SLOT',
+    'IMG','PICTURE','SOURCE','TRACK',
+    'PROGRESS','METER','OUTPUT'
+]);
+
+const NAV_ROLES = new Set([
+    'navigation','banner','contentinfo','complementary',
+    'search','form','menu','menubar','toolbar',
+    'tab','tablist','tabpanel','dialog','alertdialog',
+    'status','log','marquee','timer','tooltip'
+]);
+
+const TABLE_TAGS = new Set(['TABLE','THEAD','TBODY','TFOOT','TR','TD','TH','CAPTION','COL','COLGROUP']);
+const HEADING_TAGS = {'H1':1,'H2':2,'H3':3,'H4':4,'H5':5,'H6':6};
+const LIST_TAGS = new Set(['LI','DT','DD','UL','OL']);
+
+
+// Count whitespace-separated words, stopping at `limit` instead of splitting the whole text
+function countWords(text, limit) {
+    const wordPattern = /\S+/g;
+    let count = 0;
+    while (count < limit && wordPattern.exec(text)) count++;
+    return count;
+}
 
-    const TABLE_TAGS = new Set(['TABLE','THEAD','TBODY','TFOOT','TR','TD','TH','CAPTION','COL','COLGROUP']);
-    const HEADING_TAGS = {'H1':1,'H2':2,'H3':3,'H4':4,'H5':5,'H6':6};
 
+function extractTextNodes(selectors) {
+    // Siblings share ancestors, so each element's skip/table flags are computed once and reused
+    const ancestorFlags = new WeakMap();
+    function getAncestorFlags(el){
+        const chain = [];
+        let node = el, flags = {skip:false, table:false};
+        while(node && node !== document.body){
+            const cached = ancestorFlags.get(node);
+            if(cached){ flags = cached; break; }
+            chain.push(node);
+            node = node.parentElement;
+        }
+        for(let i = chain.length - 1; i >= 0; i--){
+            const tag = chain[i].tagName?.toUpperCase() || '';
+            const role = chain[i].getAttribute?.('role')?.toLowerCase() || '';
+            flags = {
+                skip: flags.skip || SKIP_TAGS.has(tag) || NAV_ROLES.has(role),
+                table: flags.table || TABLE_TAGS.has(tag)
+            };
+            ancestorFlags.set(chain[i], flags);
+        }
+        return flags;
+    }
 
+    // Children are measured for the parent's ratio check and then visited as candidates themselves,
+    // so each element's trimmed innerText is computed once and reused
+    const textCache = new WeakMap();
+    function getText(el){
+        let text = textCache.get(el);
+        if(text === undefined){
+            text = el.innerText?.trim() || '';
+            textCache.set(el, text);
+        }
+        return text;
+    }
 
     const elements = document.querySelectorAll(selectors.join(','));
     const blocks = [];
     const extractedTexts = [];
+    const extractedTextSet = new Set();
 
     elements.forEach(el => {
         const tagName = el.tagName?.toUpperCase() || '';
         const role = el.getAttribute('role')?.toLowerCase() || '';
-        const ariaHidden = el.getAttribute('aria-hidden') === 'true';
+        if(el.getAttribute('aria-hidden') === 'true') return;
 
         // Skip element or ancestors with skip tags/roles
-        let ancestor = el, hasSkipAncestor=false, hasTableAncestor=false;
-        while(ancestor && ancestor !== document.body){
-            const ancestorTag = ancestor.tagName?.toUpperCase() || '';
-            const ancestorRole = ancestor.getAttribute?.('role')?.toLowerCase() || '';
-            if(SKIP_TAGS.has(ancestorTag) || NAV_ROLES.has(ancestorRole)){ hasSkipAncestor=true; break; }
-            if(TABLE_TAGS.has(ancestorTag)) hasTableAncestor=true;
-            ancestor = ancestor.parentElement;
-        }
+        const {skip: hasSkipAncestor, table: hasTableAncestor} = getAncestorFlags(el);
         if(hasSkipAncestor) return;
 
         const style = getComputedStyle(el);
-        if(style.display==='none'||style.visibility==='hidden'||style.opacity==='0'||ariaHidden) return;
+        if(style.display==='none'||style.visibility==='hidden'||style.opacity==='0') return;
+        // Not rendered (e.g. inside a display:none ancestor); reject before paying for innerText
+        if(el.offsetParent === null && style.position !== 'fixed') return;
 
-        const text = el.innerText?.trim();
+        const text = getText(el);
         if(!text) return;
 
-        const wordCount = text.split(/\s+/).length;
+        // Only thresholds below 20 words are checked, so stop counting there
+        const wordCount = countWords(text, 20);
         const isTableCell = TABLE_TAGS.has(tagName);
 
         if((isTableCell || hasTableAncestor) && wordCount<20) return;
@@ -118,27 +166,33 @@ function extractTextNodes(selectors) {
         const headingLevel = HEADING_TAGS[tagName] || 0;
 
         // Duplicate check: children vs parent
-        const childrenTextLength = Array.from(el.children).reduce((acc, child) => acc + (child.innerText?.trim()?.length || 0), 0);
+        const childrenTextLength = Array.from(el.children).reduce((acc, child) => acc + getText(child).length, 0);
         if(childrenTextLength > 0 && text.length > 0 && (childrenTextLength / text.length) > 0.85) return;
 
         // Check against previously extracted texts (same logic as Python)
+        // Exact repeats hit the set; otherwise only the longer string can contain the shorter one.
+        if(extractedTextSet.has(text)) return;
         let isDuplicate = false;
         const textsToRemove = [];
-        extractedTexts.forEach((existing, idx)=>{
-            if(existing.includes(text)){
-                isDuplicate = true;
-            } else if(text.includes(existing)){
+        for(let idx = 0; idx < extractedTexts.length; idx++){
+            const existing = extractedTexts[idx];
+            if(existing === null) continue;
+            if(existing.length > text.length){
+                if(existing.includes(text)){ isDuplicate = true; break; }
+            } else if(existing.length < text.length && text.includes(existing)){
                 textsToRemove.push(idx);
             }
-        });
+        }
         if(isDuplicate) return;
-        textsToRemove.reverse().forEach(idx=>{
-            extractedTexts.splice(idx,1);
-            blocks.splice(idx,1);
+        // Tombstone superseded entries instead of splicing; compacted once at the end
+        textsToRemove.forEach(idx=>{
+            extractedTextSet.delete(extractedTexts[idx]);
+            extractedTexts[idx] = null;
+            blocks[idx] = null;
         });
 
         // Skip list items - they're handled by extractLists()
-        if(['LI','DT','DD','UL','OL'].includes(tagName)){
+        if(LIST_TAGS.has(tagName)){
             return;
         }
 
@@ -150,13 +204,14 @@ function extractTextNodes(selectors) {
             type:'text',
             text:text,
             spans:spans,
-            bbox:{x:bbox.x,y:bbox.y,width:bbox.width,height:bbox.height},
+            bbox:toBBox(bbox),
             fontSize,fontWeight,fontFamily,headingLevel
         });
         extractedTexts.push(text);
+        extractedTextSet.add(text);
     });
 
-    return blocks;
+    return blocks.filter(block => block !== null);
 }
 
 
@@ -188,12 +243,7 @@ function extractLists() {
             items: items,
             ordered: ordered,
             level: 0,
-            bbox: {
-                x: bbox.x,
-                y: bbox.y,
-                width: bbox.width,
-                height: bbox.height
-            }
+            bbox: toBBox(bbox)
         });
     }
 
@@ -215,7 +265,7 @@ function extractImages() {
         blocks.push({
             type:'image',
             src:img.src,
-            bbox:{x:bbox.x,y:bbox.y,width:bbox.width,height:bbox.height},
+            bbox:toBBox(bbox),
             alt: img.getAttribute('alt') || null
         });
     }
@@ -249,12 +299,7 @@ function extractTables() {
         blocks.push({
             type: "table",
             rows: rows_data,
-            bbox: {
-                x: bbox.x,
-                y: bbox.y,
-                width: bbox.width,
-                height: bbox.height
-            }
+            bbox: toBBox(bbox)
         });
     });
 
@@ -283,14 +328,21 @@ function extractLinks() {
             type: "link",
             href: href,
             spans: spans,
-            bbox: {
-                x: bbox.x,
-                y: bbox.y,
-                width: bbox.width,
-                height: bbox.height
-            }
+            bbox: toBBox(bbox)
         });
     }
 
     return blocks;
 }
+
+
+// Run every extractor in a single evaluate to avoid one round-trip per block type
+function extractAll(selectors) {
+    return {
+        text: extractTextNodes(selectors),
+        images: extractImages(),
+        tables: extractTables(),
+        links: extractLinks(),
+        lists: extractLists()
+    };
+}
@@ -1,10 +1,15 @@
 """Core DOM-based block extraction with merged lists."""
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack, contextmanager
 from typing import Any, Generator, TypedDict
 import json
+import queue
+import re
+import sys
+import threading
 
-from playwright.sync_api import Page, sync_playwright, Browser
+from playwright.sync_api import Page, Route, sync_playwright, Browser
 import pathlib
 
 from src.blocks.models import (
@@ -20,18 +25,36 @@ from src.blocks.models import (
 from src.common.models import Span
 
 
-class ListBBox(TypedDict):
-    x: float
-    y: float
-    width: float
-    height: float
-    text: str
+TEXT_SELECTORS = (
+    "p",
+    "div",
+    "li",
+    "dt",
+    "dd",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "pre",
+    "code",
+    "section",
+    "article",
+    "main",
+    "a",
+    "blockquote",
+)
+
+
+# Positional span layout emitted by extractSpans(): (text, formats, font_size, font_weight, font_family)
+SpanData = tuple[str, list[str], float | None, float | None, str | None]
 
 
 class ElementData(TypedDict):
-    bbox: dict[str, float]
+    bbox: list[float]  # (x0, y0, x1, y1)
     text: str
-    spans: list[dict[str, Any]] | None
+    spans: list[SpanData] | None
     fontSize: float
     fontWeight: float
     fontFamily: str | None
@@ -41,12 +64,33 @@ class ElementData(TypedDict):
     isBlockquote: bool
 
 
+class ExtractedData(TypedDict):
+    text: list[ElementData]
+    images: list[dict[str, Any]]
+    tables: list[dict[str, Any]]
+    links: list[dict[str, Any]]
+    lists: list[dict[str, Any]]
+
+
 PYTHON_FILE_DIR = pathlib.Path(__file__).parent.resolve()
 
 INTERNAL_SCRIPT_CODE = (PYTHON_FILE_DIR / "core.js").read_text()
 
 IIFE_WRAPPER = "(() => {{\n{}\n}})()"
 
+# Installed once per page via add_init_script; only __extractAllJson() leaks onto window.
+# The result is stringified in the page: one string crosses the wire and is decoded by the C json parser,
+# instead of Playwright deserializing every nested value in Python. JSON.stringify is captured before any
+# page script runs, so pages that polyfill or override it can't corrupt the payload.
+INIT_SCRIPT_CODE = IIFE_WRAPPER.format(
+    "if (window.__extractAllJson) return;\nconst stringify = JSON.stringify;\n\n"
+    f"{INTERNAL_SCRIPT_CODE}\n\n"
+    "window.__extractAllJson = (selectors) => stringify(extractAll(selectors));"
+)
+
+# Selectors are baked in so each evaluate ships a constant string and no arguments.
+EXTRACT_ALL_CODE = f"() => window.__extractAllJson({json.dumps(TEXT_SELECTORS)})"
+
 
 @contextmanager
 def browser() -> Generator[Browser, Any, Any]:
@@ -62,13 +106,81 @@ def browser() -> Generator[Browser, Any, Any]:
         playwright.stop()
 
 
+# Launching Chromium dominates the cost of a single extraction, so inside a `browser_pool()` scope one
+# browser is kept warm and reused. The sync API is bound to the thread that started it, hence per thread.
+_pool = threading.local()
+
+
+@contextmanager
+def browser_pool() -> Generator[None, Any, Any]:
+    """Reuse one browser for every extraction on the calling thread until the scope exits.
+
+    Outside a scope each extraction launches and closes its own browser, so a caller extracting a single URL
+    gains nothing from a pool; it pays off when several URLs are extracted in the same scope.
+    """
+    if getattr(_pool, "active", False):  # nested scope: the outer one owns the browser
+        yield
+        return
+
+    _pool.active = True
+    try:
+        yield
+    finally:
+        _pool.active = False
+        _close_browser()
+
+
+def _get_browser() -> Browser:
+    """Return the calling thread's pooled browser, launching it on first use."""
+    browser_instance: Browser | None = getattr(_pool, "browser", None)
+    if browser_instance is not None and browser_instance.is_connected():
+        return browser_instance
+
+    _close_browser()  # drop a crashed/disconnected browser before relaunching
+    stack = ExitStack()
+    _pool.browser = browser_instance = stack.enter_context(browser())
+    _pool.stack = stack
+    return browser_instance
+
+
+def _close_browser() -> None:
+    """Close the calling thread's pooled browser, if one is running."""
+    stack: ExitStack | None = getattr(_pool, "stack", None)
+    _pool.browser = _pool.stack = None
+    if stack is not None:
+        stack.close()
+
+
+# Fonts and media don't change what gets extracted (fonts only nudge glyph metrics via the fallback).
+# Matched by URL so that every other request is continued natively without a round-trip into Python.
+# Images and stylesheets are kept: both change element sizes, computed styles and visibility.
+BLOCKED_RESOURCES = re.compile(
+    r"\.(woff2?|ttf|otf|eot|mp4|webm|ogv|mov|mp3|ogg|wav|flac)(\?|#|$)",
+    re.IGNORECASE,
+)
+
+
+def _block_resource(route: Route) -> None:
+    """Abort a request matched by BLOCKED_RESOURCES."""
+    route.abort()
+
+
 @contextmanager
 def _pw_page(url: str) -> Generator[Page, Any, Any]:
-    """Context manager for creating a page and navigating to URL."""
+    """Context manager for creating a page in a fresh browser context and navigating to URL.
+
+    Uses the thread's pooled browser inside a `browser_pool()` scope, otherwise launches one for this call.
+    """
     with ExitStack() as stack:
-        browser_instance = stack.enter_context(browser())
-        page = browser_instance.new_page()
-        stack.callback(page.close)
+        if getattr(_pool, "active", False):
+            browser_instance = _get_browser()
+        else:
+            browser_instance = stack.enter_context(browser())
+        context = browser_instance.new_context()
+        stack.callback(context.close)
+        page = context.new_page()
+        page.add_init_script(script=INIT_SCRIPT_CODE)
+        page.route(BLOCKED_RESOURCES, _block_resource)
         page.goto(url, wait_until="domcontentloaded", timeout=10000)
         try:
             # Scroll to bottom to trigger lazy-loaded content
@@ -88,113 +200,72 @@ def _pw_page(url: str) -> Generator[Page, Any, Any]:
             #         });
             #     }
             # """)
-            page.wait_for_timeout(500)  # stability wait
+            # Settle until the network goes quiet rather than sleeping blindly, so client-rendered content
+            # gets to fetch and render; still capped at the old 500ms
+            page.wait_for_load_state("networkidle", timeout=500)
         except Exception:
             pass
 
         yield page
 
 
-def _extract_text_blocks(page: Page) -> list[TextBlock]:
-    """Use extractTextNodes.js for fast text block extraction."""
-    selectors = [
-        "p",
-        "div",
-        "li",
-        "dt",
-        "dd",
-        "h1",
-        "h2",
-        "h3",
-        "h4",
-        "h5",
-        "h6",
-        "pre",
-        "code",
-        "section",
-        "article",
-        "main",
-        "a",
-        "blockquote",
+def _intern(value: str | None) -> str | None:
+    """Intern a repetitive style string (e.g. font family) so equal values share one object."""
+    return sys.intern(value) if value is not None else None
+
+
+def _to_spans(span_list: list[SpanData]) -> list[Span]:
+    """Build Span objects from the positional span layout emitted by extractSpans()."""
+    return [
+        Span.model_construct(
+            text=text,
+            formats=formats,
+            font_size=font_size,
+            font_weight=font_weight,
+            font_family=_intern(font_family),
+        )
+        for text, formats, font_size, font_weight, font_family in span_list
     ]
-    element_data: list[ElementData] = page.evaluate(
-        IIFE_WRAPPER.format(INTERNAL_SCRIPT_CODE + f"\n\nreturn extractTextNodes({json.dumps(selectors)});")
-    )
 
+
+def _extract_text_blocks(element_data: list[ElementData]) -> list[TextBlock]:
+    """Build text blocks from the output of extractTextNodes().
+
+    The payload comes from our own script and is already well-formed, so blocks are built with
+    `model_construct` to skip per-field validation. The same applies to the other `_extract_*` helpers.
+    """
     blocks: list[TextBlock] = []
     for data in element_data:
-        bbox = data["bbox"]
-
-        # Convert span dicts to Span objects if available
-        spans: list[Span] | None = None
-        if data.get("spans"):
-            span_list = data["spans"]
-            if span_list is not None:
-                spans = [
-                    Span(
-                        text=span["text"],
-                        formats=span["formats"],
-                        font_size=span.get("font_size"),
-                        font_weight=span.get("font_weight"),
-                        font_family=span.get("font_family"),
-                    )
-                    for span in span_list
-                ]
+        span_list = data.get("spans")
+        spans: list[Span] | None = _to_spans(span_list) if span_list else None
 
         blocks.append(
-            TextBlock(
+            TextBlock.model_construct(
                 type=BlockType.TEXT,
                 text=data["text"],
                 spans=spans,
-                bbox=(
-                    bbox["x"],
-                    bbox["y"],
-                    bbox["x"] + bbox["width"],
-                    bbox["y"] + bbox["height"],
-                ),
+                bbox=tuple(data["bbox"]),
                 font_size=data.get("fontSize", 0),
                 font_weight=data.get("fontWeight", 0),
-                font_family=data.get("fontFamily"),
+                font_family=_intern(data.get("fontFamily")),
                 heading_level=data.get("headingLevel", 0),
             )
         )
     return blocks
 
 
-def _extract_lists(page: Page) -> list[ListBlock]:
-    """Extract lists by calling extractLists() JS function in the page."""
-    element_data: list[dict[str, Any]] = page.evaluate(
-        IIFE_WRAPPER.format(f"{INTERNAL_SCRIPT_CODE}\n\nreturn extractLists();")
-    )
+def _extract_lists(element_data: list[dict[str, Any]]) -> list[ListBlock]:
+    """Build list blocks from the output of extractLists()."""
 
     blocks: list[ListBlock] = []
     for data in element_data:
-        bbox = data["bbox"]
-
-        # Convert items - each item is a list of span dicts
-        items: list[list[Span]] = []
-        for item_spans in data.get("items", []):
-            spans = [
-                Span(
-                    text=span["text"],
-                    formats=span["formats"],
-                    font_size=span.get("font_size"),
-                    font_weight=span.get("font_weight"),
-                    font_family=span.get("font_family"),
-                )
-                for span in item_spans
-            ]
-            items.append(spans)
+        # Each item is a list of positional spans
+        items = [_to_spans(item_spans) for item_spans in data.get("items", [])]
 
         blocks.append(
-            ListBlock(
+            ListBlock.model_construct(
                 type=BlockType.LIST,
-                bbox=(
-                    bbox["x"],
-                    bbox["y"],
-                    bbox["x"] + bbox["width"],
-                    bbox["y"] + bbox["height"],
-                ),
+                bbox=tuple(data["bbox"]),
                 items=items,
                 ordered=data.get("ordered", False),
                 level=data.get("level", 0),
@@ -204,24 +275,17 @@ def _extract_lists(page: Page) -> list[ListBlock]:
     return blocks
 
 
-def _extract_images(page: Page):
-    """Extract <img> blocks."""
-    img_elements = page.evaluate(IIFE_WRAPPER.format(f"{INTERNAL_SCRIPT_CODE}\n\nreturn extractImages();"))
+def _extract_images(img_elements: list[dict[str, Any]]) -> list[ImageBlock]:
+    """Build <img> blocks from the output of extractImages()."""
     blocks: list[ImageBlock] = []
 
     for img in img_elements:
-        bbox = img["bbox"]
         src = img["src"]
 
         blocks.append(
-            ImageBlock(
+            ImageBlock.model_construct(
                 type=BlockType.IMAGE,
-                bbox=(
-                    bbox["x"],
-                    bbox["y"],
-                    bbox["x"] + bbox["width"],
-                    bbox["y"] + bbox["height"],
-                ),
+                bbox=tuple(img["bbox"]),
                 src=src,
                 alt=img.get("alt", None),
             )
@@ -230,24 +294,15 @@ def _extract_images(page: Page):
     return blocks
 
 
-def _extract_tables(page: Page) -> list[TableBlock]:
-    """Extract tables by calling extractTables() JS function in the page."""
-    element_data: list[dict[str, Any]] = page.evaluate(
-        IIFE_WRAPPER.format(f"{INTERNAL_SCRIPT_CODE}\n\nreturn extractTables();")
-    )  # JS returns list of table objects
+def _extract_tables(element_data: list[dict[str, Any]]) -> list[TableBlock]:
+    """Build table blocks from the output of extractTables()."""
 
     blocks: list[TableBlock] = []
     for data in element_data:
-        bbox = data["bbox"]
         blocks.append(
-            TableBlock(
+            TableBlock.model_construct(
                 type=BlockType.TABLE,
-                bbox=(
-                    bbox["x"],
-                    bbox["y"],
-                    bbox["x"] + bbox["width"],
-                    bbox["y"] + bbox["height"],
-                ),
+                bbox=tuple(data["bbox"]),
                 rows=data["rows"],
             )
         )
@@ -255,41 +310,18 @@ def _extract_tables(page: Page) -> list[TableBlock]:
     return blocks
 
 
-def _extract_links(page: Page) -> list[LinkBlock]:
-    """Extract links by calling extractLinks() JS function in the page."""
-    element_data: list[dict[str, Any]] = page.evaluate(
-        IIFE_WRAPPER.format(f"{INTERNAL_SCRIPT_CODE}\n\nreturn extractLinks();")
-    )  # JS returns list of link objects
+def _extract_links(element_data: list[dict[str, Any]]) -> list[LinkBlock]:
+    """Build link blocks from the output of extractLinks()."""
 
     blocks: list[LinkBlock] = []
     for data in element_data:
-        bbox = data["bbox"]
-
-        # Convert span dicts to Span objects
-        spans: list[Span] = []
-        if data.get("spans"):
-            span_list = data["spans"]
-            if span_list is not None:
-                spans = [
-                    Span(
-                        text=span["text"],
-                        formats=span["formats"],
-                        font_size=span.get("font_size"),
-                        font_weight=span.get("font_weight"),
-                        font_family=span.get("font_family"),
-                    )
-                    for span in span_list
-                ]
+        span_list = data.get("spans")
+        spans: list[Span] = _to_spans(span_list) if span_list else []
 
         blocks.append(
-            LinkBlock(
+            LinkBlock.model_construct(
                 type=BlockType.LINK,
-                bbox=(
-                    bbox["x"],
-                    bbox["y"],
-                    bbox["x"] + bbox["width"],
-                    bbox["y"] + bbox["height"],
-                ),
+                bbox=tuple(data["bbox"]),
                 href=data["href"],
                 spans=spans,
             )
@@ -299,14 +331,49 @@ def _extract_links(page: Page) -> list[LinkBlock]:
 
 
 def extract_raw_blocks(url: str) -> BlockArray:
-    """Extract text, images, table, and link blocks from a URL."""
+    """Extract text, images, table, and link blocks from a URL.
+
+    Launches a browser for this call alone unless called inside a `browser_pool()` scope.
+    """
     blocks: list[Block] = []
 
     with _pw_page(url) as page:
-        blocks.extend(_extract_text_blocks(page))
-        blocks.extend(_extract_images(page))
-        blocks.extend(_extract_tables(page))
-        blocks.extend(_extract_links(page))
-        blocks.extend(_extract_lists(page))
-
-    return BlockArray(url=url, blocks=blocks)
+        # One round-trip for every extractor instead of one per block type
+        data: ExtractedData = json.loads(page.evaluate(EXTRACT_ALL_CODE))
+
+    blocks.extend(_extract_text_blocks(data["text"]))
+    blocks.extend(_extract_images(data["images"]))
+    blocks.extend(_extract_tables(data["tables"]))
+    blocks.extend(_extract_links(data["links"]))
+    blocks.extend(_extract_lists(data["lists"]))
+
+    return BlockArray.model_construct(url=url, blocks=blocks)
+
+
+def extract_raw_blocks_many(urls: list[str], workers: int = 8) -> list[BlockArray]:
+    """Extract blocks from several URLs in parallel, returning results in input order.
+
+    Each worker thread runs in a `browser_pool()` scope, driving its own browser (one context per URL)
+    and closing it once the queue is drained.
+    """
+    pending: queue.SimpleQueue[tuple[int, str]] = queue.SimpleQueue()
+    for item in enumerate(urls):
+        pending.put(item)
+    results: dict[int, BlockArray] = {}
+
+    def worker() -> None:
+        with browser_pool():
+            while True:
+                try:
+                    idx, url = pending.get_nowait()
+                except queue.Empty:
+                    return
+                results[idx] = extract_raw_blocks(url)
+
+    workers = max(1, min(workers, len(urls)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(worker) for _ in range(workers)]
+        for future in futures:
+            future.result()  # re-raise the first worker error, if any
+
+    return [results[idx] for idx in range(len(urls))]
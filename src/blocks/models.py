@@ -62,3 +62,7 @@ class ListBlock(Block):
 class BlockArray(BaseModel):
     url: str  # what page this came from
     blocks: list[Block]  # the blocks
+
+    def to_json(self) -> str:
+        """Serialize directly to JSON in pydantic-core, keeping each block's subclass fields."""
+        return self.model_dump_json(serialize_as_any=True)
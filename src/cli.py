@@ -1,8 +1,7 @@
 """Quick dirty CLI for testing and stuff."""
 
 import argparse
-from src.common.utils.logger import logger
-from src.common.utils.config import config
+from pathlib import Path
 
 
 def main():
@@ -25,6 +24,9 @@ def main():
 
     args = parser.parse_args()
 
+    # Imported after parsing so --help and argument errors skip logger setup and the config/processor imports
+    from src.common.utils.logger import logger
+
     action = args.action or "extract"
 
     if action == "extract":
@@ -41,14 +43,15 @@ def main():
 
             case "markdown":
                 logger.info("Generating markdown output...")
-                with open("output.md", "w", encoding="utf-8") as f:
-                    f.write(blocks.markdown)
+                Path("output.md").write_bytes(blocks.markdown.encode("utf-8"))
                 logger.info("Markdown output written to output.md")
 
             case _:
                 logger.error(f"Unknown format: {args.format}")
 
     elif action == "config":
+        from src.common.utils.config import config
+
         logger.info("Configuration:\n")
         for key, value in sorted(config.model_dump().items()):
             print(f"{key}={value}")
@@ -2,8 +2,11 @@
 Load configuration from `config.toml`.
 """
 
+from functools import cache, cached_property
 from pathlib import Path
-from pydantic import BaseModel, field_validator
+import re
+import tomllib
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
 
 THIS_DIR = Path(__file__).parent.resolve()
 
@@ -21,18 +24,28 @@ class Config(BaseModel):
     skip_patterns: list[str]
     header_thresholds: dict[int, float]
 
-    @field_validator(
-        "bold_threshold",
-        "header_threshold",
-        "footer_threshold",
-        "small_text_threshold",
-        mode="before",
-    )
-    @staticmethod
-    def between_zero_and_one(value: float) -> float:
-        if not (0.0 <= value <= 1.0):
-            raise ValueError("Value must be between 0 and 1.")
-        return value
+    # Frozen: derived values (e.g. `skip_regex`) are cached on the instance, so a config must be replaced via
+    # `set_config` rather than edited in place.
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    @cached_property
+    def skip_regex(self) -> re.Pattern[str]:
+        """`skip_patterns` as one compiled alternation, so text is scanned once rather than per pattern."""
+        if not self.skip_patterns:
+            return re.compile(r"(?!)")  # never matches
+        return re.compile("|".join(map(re.escape, self.skip_patterns)))
+
+    @cached_property
+    def sorted_header_thresholds(self) -> list[tuple[int, float]]:
+        """`header_thresholds` as (level, size multiplier) pairs, largest multiplier first."""
+        return sorted(self.header_thresholds.items(), key=lambda x: x[1], reverse=True)
+
+    @model_validator(mode="after")
+    def between_zero_and_one(self) -> "Config":
+        for name in ("bold_threshold", "header_threshold", "footer_threshold", "small_text_threshold"):
+            if not (0.0 <= getattr(self, name) <= 1.0):
+                raise ValueError(f"{name} must be between 0 and 1.")
+        return self
 
     @field_validator("header_thresholds", mode="before")
     @staticmethod
@@ -47,11 +60,11 @@ class Config(BaseModel):
         return result
 
 
+@cache
 def load_config() -> Config:
-    import tomli
-
+    # stdlib parser (3.11+); tomli was never a declared dependency
     with open(CONFIG_FILE_PATH, "rb") as f:
-        data = tomli.load(f)
+        data = tomllib.load(f)
 
     config_data = {k.lower(): v for k, v in data.items()}
     return Config(**config_data)
@@ -22,10 +22,13 @@ class ColorFormatter(logging.Formatter):
     """Only color console output."""
 
     def format(self, record: logging.LogRecord) -> str:
-        if getattr(record, "use_color", False):
-            color = COLORS.get(record.levelname, "")
-            record.levelname = f"{color}{record.levelname:<7}{RESET}"
-        return super().format(record)
+        # Color a temporary levelname: the record is shared with the file handler
+        levelname = record.levelname
+        record.levelname = f"{COLORS.get(levelname, '')}{levelname:<7}{RESET}"
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 # -------------------------------------------------------------------
@@ -50,13 +53,11 @@ LOG_FILE = os.path.join(LOG_DIR, "app.log")
 console_handler = logging.StreamHandler(sys.stdout)
 console_handler.setLevel(NOTICE_LEVEL)
 console_handler.setFormatter(ColorFormatter(LOG_FORMAT, datefmt=DATE_FORMAT))
-console_handler.addFilter(lambda record: setattr(record, "use_color", True) or True)
-console_handler.addFilter(lambda record: record.levelno >= NOTICE_LEVEL)
 
 file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
 file_handler.setLevel(logging.DEBUG)
 file_handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT))
-file_handler.addFilter(lambda record: record.name.startswith("app"))
+file_handler.addFilter(logging.Filter("app"))  # "app" and its children
 
 
 root_logger = logging.getLogger()
@@ -11,12 +11,11 @@ class Statistics(BaseModel):
     count: int
 
 
-def _median(values: list[float]) -> float:
-    """Compute the median of a list of values."""
-    n = len(values)
+def _median(sorted_vals: list[float]) -> float:
+    """Compute the median of an already sorted list of values."""
+    n = len(sorted_vals)
     if n == 0:
         return 0.0
-    sorted_vals = sorted(values)
     mid = n // 2
     if n % 2 == 0:
         return (sorted_vals[mid - 1] + sorted_vals[mid]) / 2
@@ -41,13 +40,16 @@ def statistics(values: list[float]) -> Statistics:
     Returns:
         Statistics: The computed statistics.
     """
+    # Every field is computed here, so validation is skipped; the floats are coerced by hand instead
     if not values:
-        return Statistics(mean=0.0, median=0.0, min=0.0, max=0.0, count=0)
+        return Statistics.model_construct(mean=0.0, median=0.0, min=0.0, max=0.0, count=0)
 
-    return Statistics(
-        mean=_average(values),
-        median=_median(values),
-        min=min(values),
-        max=max(values),
+    # Sort once; min, max and median all fall out of the sorted copy
+    sorted_vals = sorted(values)
+    return Statistics.model_construct(
+        mean=float(_average(values)),
+        median=float(_median(sorted_vals)),
+        min=float(sorted_vals[0]),
+        max=float(sorted_vals[-1]),
         count=len(values),
     )
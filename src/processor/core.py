@@ -1,5 +1,7 @@
 """Core."""
 
+import hashlib
+
 from src.blocks.models import (
     BlockArray as RawBlockArray,
     TextBlock as RawTextBlock,
@@ -22,7 +24,7 @@ from src.processor.models import (
     ListBlock,
 )
 from src.common.utils.config import config
-from typing import overload
+from typing import Any, Callable, NamedTuple, overload
 from src.processor.post_filters import filter_blocks
 
 
@@ -30,85 +32,171 @@ def compute_page_metrics(raw_blocks: RawBlockArray) -> PageMetrics:
     """Compute page metrics from raw blocks."""
     font_sizes: list[float] = []
     font_weights: list[float] = []
+    max_y = 0.0
 
+    # One pass collects both the font samples and the page extent used for the header/footer bounds
     for block in raw_blocks.blocks:
+        bottom = block.bbox[3]
+        if bottom > max_y:
+            max_y = bottom
         if isinstance(block, RawTextBlock):
             font_sizes.append(block.font_size)
             font_weights.append(block.font_weight)
 
-    return PageMetrics(font_size=statistics(font_sizes), font_weight=statistics(font_weights))
+    return PageMetrics.model_construct(
+        font_size=statistics(font_sizes), font_weight=statistics(font_weights), max_y=float(max_y)
+    )
 
 
 def reading_order(raw_blocks: RawBlockArray) -> RawBlockArray:
     """Reorder blocks by reading order (top-to-bottom, left-to-right)."""
-    blocks = sorted(raw_blocks.blocks, key=lambda b: (b.bbox[1], b.bbox[0]))
-    result: list[RawBlock] = []
-    current_line = []
-    last_y = None
+    blocks = raw_blocks.blocks
+    y_tolerance = config.reading_order_y_tolerance
 
-    for block in blocks:
-        y = block.bbox[1]
-        if last_y is None or abs(y - last_y) <= config.reading_order_y_tolerance:
-            current_line.append(block)
-        else:
-            result.extend(sorted(current_line, key=lambda b: b.bbox[0]))
-            current_line = [block]
+    # Read each block's (y, x) once; both sorts below order indices by plain tuples, with no key lambdas
+    positions = [(b.bbox[1], b.bbox[0]) for b in blocks]
+    by_y = sorted(range(len(blocks)), key=positions.__getitem__)
+
+    # Chain blocks into lines by vertical proximity, then order every line left-to-right in one stable sort
+    # instead of sorting (and allocating) each line separately.
+    line_keys: list[tuple[int, float]] = []
+    line = 0
+    last_y = None
+    for i in by_y:
+        y, x = positions[i]
+        if last_y is not None and abs(y - last_y) > y_tolerance:
+            line += 1
+        line_keys.append((line, x))
         last_y = y
 
-    if current_line:
-        result.extend(sorted(current_line, key=lambda b: b.bbox[0]))
+    order = sorted(range(len(by_y)), key=line_keys.__getitem__)
+    result: list[RawBlock] = [blocks[by_y[i]] for i in order]
+
+    return RawBlockArray.model_construct(url=raw_blocks.url, blocks=result)
+
+
+class _PageThresholds(NamedTuple):
+    """Font cut-offs for one page, scaled from its metrics once instead of per block and span."""
+
+    small_text: float
+    bold_weight: float
+    headings: list[tuple[int, float]]  # (level, minimum font size), largest size first
 
-    return RawBlockArray(url=raw_blocks.url, blocks=result)
 
+def _compute_page_thresholds(metrics: PageMetrics) -> _PageThresholds:
+    """Scale the configured multipliers by the page's mean font size and weight."""
+    font_size = metrics.font_size.mean
+    return _PageThresholds(
+        small_text=font_size * config.small_text_threshold,
+        bold_weight=metrics.font_weight.mean * (1 + config.bold_threshold),
+        headings=[(level, font_size * multiplier) for level, multiplier in config.sorted_header_thresholds],
+    )
 
-def _determine_heading_level(block: RawTextBlock, metrics: PageMetrics) -> int:
+
+def _determine_heading_level(block: RawTextBlock, thresholds: _PageThresholds) -> int:
     """Determine heading level from semantic tags or font size."""
     if block.heading_level > 0:
         return block.heading_level
 
-    for level, size_multiplier in sorted(
-        config.header_thresholds.items(),
-        key=lambda x: x[1],
-        reverse=True,
-    ):
-        if block.font_size >= metrics.font_size.mean * size_multiplier:
+    for level, min_size in thresholds.headings:
+        if block.font_size >= min_size:
             return level
 
     return 0
 
 
-def _is_text_duplicate(normalized: str, seen_texts: set[str]) -> bool:
-    """Check if text is a duplicate or substring of existing text."""
-    if normalized in seen_texts:
-        return True
-    return any(normalized in seen or seen in normalized for seen in seen_texts)
+class _SubstringIndex:
+    """Set of normalized texts answering "is this text equal to, inside, or around any seen text?".
+
+    Seen texts are joined into one corpus so "inside a seen text" is a single C-level search, skipped when the
+    query has a word no seen text contains. For "around a seen text", seen texts are bucketed by their leading
+    n-gram so only those that could start at some offset of the query are compared. Normalized texts never
+    contain newlines, so one is used as separator.
+    """
+
+    GRAM = 8
+
+    def __init__(self):
+        self.texts: set[str] = set()
+        self._parts: list[str] = []
+        self._corpus: str | None = ""
+        self._by_gram: dict[str, list[str]] = {}
+        self._long_count = 0
+        self._short: list[str] = []  # too short to have a leading n-gram
+        self._words: set[str] = set()  # vocabulary of every seen text
+
+    def add(self, text: str):
+        if text in self.texts:
+            return
+        self.texts.add(text)
+        self._parts.append(text)
+        self._corpus = None  # rebuilt lazily on the next query
+        self._words.update(text.split(" "))
+        if len(text) >= self.GRAM:
+            self._by_gram.setdefault(text[: self.GRAM], []).append(text)
+            self._long_count += 1
+        else:
+            self._short.append(text)
+
+    def _in_corpus(self, text: str) -> bool:
+        """Check if text occurs inside any seen text."""
+        # Text inside a seen text has all of its interior (whole) words in the seen vocabulary, so a single
+        # unknown word rules out the corpus search; novel paragraphs usually miss on their first words.
+        interior = text.split(" ")[1:-1]
+        if not all(word in self._words for word in interior):
+            return False
+        if self._corpus is None:
+            self._corpus = "\n".join(self._parts)
+        return text in self._corpus
+
+    def overlaps(self, text: str) -> bool:
+        """Check if text is a duplicate or substring of a seen text, or contains one."""
+        if not self.texts:
+            return False
+        if text in self.texts:
+            return True
+
+        if self._in_corpus(text):
+            return True
+
+        if any(seen in text for seen in self._short):
+            return True
+
+        # Scan whichever is smaller: the query's offsets, or the long seen texts themselves
+        gram = self.GRAM
+        if self._long_count <= len(text) - gram + 1:
+            return any(seen in text for seen in self._parts if len(seen) >= gram)
+        for i in range(len(text) - gram + 1):
+            for seen in self._by_gram.get(text[i : i + gram], ()):
+                if text.startswith(seen, i):
+                    return True
+        return False
 
 
-def _hash_table(rows: list[list[str]]) -> str:
+def _hash_table(rows: list[list[str]]) -> bytes:
     """Create a hash of table content for deduplication."""
-    # Normalize and join all table cells into a single string
+    # Normalize and join all table cells into a single string, then keep only its digest
     normalized_rows: list[str] = []
     for row in rows:
         normalized_row = [" ".join(cell.lower().split()) for cell in row]
         normalized_rows.append("|".join(normalized_row))
-    return "\n".join(normalized_rows)
+    return hashlib.blake2b("\n".join(normalized_rows).encode(), digest_size=16).digest()
 
 
-def _build_spans_from_text_block(block: RawTextBlock, text: str, metrics: PageMetrics) -> list[Span]:
+def _build_spans_from_text_block(block: RawTextBlock, text: str, thresholds: _PageThresholds) -> list[Span]:
     """Build spans from raw text block span data or create a single span."""
+    bold_weight = thresholds.bold_weight
     if block.spans:
         spans: list[Span] = []
         for span_data in block.spans:
             formats: set[str] = set()
-            if span_data.font_weight is not None and span_data.font_weight >= metrics.font_weight.mean * (
-                1 + config.bold_threshold
-            ):
+            if span_data.font_weight is not None and span_data.font_weight >= bold_weight:
                 formats.add("bold")
 
             formats.update(span_data.formats)
 
             spans.append(
-                Span(
+                Span.model_construct(
                     text=span_data.text,
                     formats=formats,
                     font_size=span_data.font_size,
@@ -118,9 +206,9 @@ def _build_spans_from_text_block(block: RawTextBlock, text: str, metrics: PageMe
             )
         return spans
     else:
-        bold = block.font_weight >= metrics.font_weight.mean * (1 + config.bold_threshold)
+        bold = block.font_weight >= bold_weight
         return [
-            Span(
+            Span.model_construct(
                 text=text,
                 formats={"bold"} if bold else {"none"},
                 font_size=block.font_size,
@@ -130,16 +218,16 @@ def _build_spans_from_text_block(block: RawTextBlock, text: str, metrics: PageMe
         ]
 
 
-def _handle_text_block(block: RawTextBlock, metrics: PageMetrics) -> list[ParagraphBlock]:
-    """Convert a raw text block into ParagraphBlock(s) using page-level metrics."""
+def _handle_text_block(block: RawTextBlock, thresholds: _PageThresholds) -> list[ParagraphBlock]:
+    """Convert a raw text block into ParagraphBlock(s) using page-level thresholds."""
     text = (block.text or "").strip()
     if not text:
         return []
 
     if block.is_code:
-        spans = [Span(text=text, formats={"code"})]
+        spans = [Span.model_construct(text=text, formats={"code"})]
         return [
-            ParagraphBlock(
+            ParagraphBlock.model_construct(
                 spans=spans,
                 heading=0,
                 is_code=True,
@@ -147,28 +235,27 @@ def _handle_text_block(block: RawTextBlock, metrics: PageMetrics) -> list[Paragr
             )
         ]
 
-    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
-    if not paragraphs:
+    # Size and heading level depend only on the block, so classify it once rather than per paragraph
+    if block.font_size <= thresholds.small_text:
         return []
 
-    result: list[ParagraphBlock] = []
-    for para_text in paragraphs:
-        cleaned_text = " ".join(para_text.split())
-        if not cleaned_text:
-            continue
+    heading = _determine_heading_level(block, thresholds)
 
-        if block.font_size <= metrics.font_size.mean * config.small_text_threshold:
+    result: list[ParagraphBlock] = []
+    for para_text in text.split("\n\n"):
+        # split() already drops surrounding whitespace, so no separate strip() passes are needed
+        words = para_text.split()
+        if not words:
             continue
+        cleaned_text = " ".join(words)
 
-        heading = _determine_heading_level(block, metrics)
-
-        spans = _build_spans_from_text_block(block, cleaned_text, metrics)
+        spans = _build_spans_from_text_block(block, cleaned_text, thresholds)
 
         if block.is_blockquote and spans:
             spans[0].text = f"> {spans[0].text}"
 
         result.append(
-            ParagraphBlock(
+            ParagraphBlock.model_construct(
                 spans=spans,
                 heading=heading,
                 is_code=False,
@@ -181,26 +268,21 @@ def _handle_text_block(block: RawTextBlock, metrics: PageMetrics) -> list[Paragr
 
 class _DuplicateTracker:
     def __init__(self):
-        self.seen_texts: set[str] = set()
+        self.seen_texts = _SubstringIndex()
         self.text_to_index: dict[str, int] = {}
         self.seen_images: set[str] = set()  # Track image srcs
-        self.seen_tables: set[str] = set()  # Track table content hashes
+        self.seen_tables: set[bytes] = set()  # Track table content hashes
 
     def is_duplicate(self, normalized: str) -> bool:
-        return normalized in self.seen_texts
+        return normalized in self.seen_texts.texts
 
     def is_substring_duplicate(self, normalized: str) -> bool:
-        return _is_text_duplicate(normalized, self.seen_texts)
+        return self.seen_texts.overlaps(normalized)
 
     def add(self, normalized: str, index: int):
         self.seen_texts.add(normalized)
         self.text_to_index[normalized] = index
 
-    def remove_at_index(self, idx: int):
-        for key in self.text_to_index:
-            if self.text_to_index[key] > idx:
-                self.text_to_index[key] -= 1
-
     def is_image_duplicate(self, src: str) -> bool:
         """Check if image source has been seen."""
         return src in self.seen_images
@@ -209,134 +291,179 @@ class _DuplicateTracker:
         """Track an image source."""
         self.seen_images.add(src)
 
-    def is_table_duplicate(self, rows: list[list[str]]) -> bool:
-        """Check if table content has been seen."""
-        table_hash = _hash_table(rows)
-        return table_hash in self.seen_tables
-
-    def add_table(self, rows: list[list[str]]):
-        """Track a table by hashing its content."""
+    def add_table(self, rows: list[list[str]]) -> bool:
+        """Track a table by hashing its content; return False if it was already seen."""
         table_hash = _hash_table(rows)
+        if table_hash in self.seen_tables:
+            return False
         self.seen_tables.add(table_hash)
+        return True
+
+
+def _normalize_paragraph(pb: ParagraphBlock) -> tuple[str, str]:
+    """Return the paragraph's lowercased text and its whitespace-collapsed form used for deduplication."""
+    lowered = pb.text.lower()
+    return lowered, " ".join(lowered.split())
 
 
-def _should_skip_paragraph(pb: ParagraphBlock, tracker: _DuplicateTracker) -> bool:
+def _should_skip_paragraph(
+    pb: ParagraphBlock, lowered: str, normalized: str, tracker: _DuplicateTracker
+) -> bool:
     """Determine if a paragraph should be skipped due to duplication."""
-    if not pb.text.strip():
+    if not normalized:
         return True
 
-    if any(pattern in pb.text.lower() for pattern in config.skip_patterns):
+    if config.skip_regex.search(lowered):
         return True
 
-    normalized = " ".join(pb.text.lower().split())
-
     if tracker.is_duplicate(normalized) and pb.heading == 0:
         return True
 
-    if tracker.is_substring_duplicate(normalized):
-        if pb.heading == 0:
-            return True
-        if normalized in tracker.text_to_index:
-            return False
+    # Headings are kept even when they overlap seen text, so only paragraphs pay for the substring check
+    if pb.heading == 0 and tracker.is_substring_duplicate(normalized):
+        return True
 
     return False
 
 
-def _handle_list_block(block: RawListBlock, metrics: PageMetrics) -> list[list[Span]]:
+def _handle_list_block(block: RawListBlock, thresholds: _PageThresholds) -> list[list[Span]]:
     """Convert raw list items into processed list items with styling."""
     # Items are already properly formatted as list[list[Span]] from extraction
     return block.items
 
 
+def _add_text_block(
+    rb: RawTextBlock, thresholds: _PageThresholds, blocks: list[BlockItem | None], tracker: _DuplicateTracker
+) -> None:
+    # Skip narrow blocks (likely sidebar remnants)
+    if rb.bbox[2] - rb.bbox[0] < 50:
+        return
+
+    for pb in _handle_text_block(rb, thresholds):
+        # Join, lowercase and collapse the span text once; both checks below reuse it
+        lowered, normalized = _normalize_paragraph(pb)
+        if _should_skip_paragraph(pb, lowered, normalized, tracker):
+            continue
+
+        # Handle heading replacing non-heading duplicate
+        if pb.heading > 0:
+            idx = tracker.text_to_index.get(normalized)
+            if idx is not None:
+                block = blocks[idx]
+                if isinstance(block, ParagraphBlock) and block.heading == 0:
+                    blocks[idx] = None
+
+        tracker.add(normalized, len(blocks))
+        blocks.append(pb)
+
+
+def _add_image_block(
+    rb: RawImageBlock, thresholds: _PageThresholds, blocks: list[BlockItem | None], tracker: _DuplicateTracker
+) -> None:
+    if tracker.is_image_duplicate(rb.src):
+        return
+    tracker.add_image(rb.src)
+    blocks.append(
+        ImageBlock.model_construct(
+            src=rb.src,
+            alt=rb.alt,
+            dimensions=(round(rb.bbox[2] - rb.bbox[0]), round(rb.bbox[3] - rb.bbox[1])),
+            bbox=rb.bbox,
+        )
+    )
+
+
+def _add_table_block(
+    rb: RawTableBlock, thresholds: _PageThresholds, blocks: list[BlockItem | None], tracker: _DuplicateTracker
+) -> None:
+    # Hash the table once for both the duplicate check and tracking
+    if not tracker.add_table(rb.rows):
+        return
+    rb.rows = [
+        [cell.replace("\n", " ").strip() for cell in row] for row in rb.rows
+    ]  # line breaks malform tables
+    blocks.append(
+        TableBlock.model_construct(
+            rows=rb.rows,
+            bbox=rb.bbox,
+        )
+    )
+
+
+def _add_link_block(
+    rb: RawLinkBlock, thresholds: _PageThresholds, blocks: list[BlockItem | None], tracker: _DuplicateTracker
+) -> None:
+    blocks.append(
+        LinkBlock.model_construct(
+            href=rb.href,
+            spans=rb.spans,
+            bbox=rb.bbox,
+        )
+    )
+
+
+def _add_list_block(
+    rb: RawListBlock, thresholds: _PageThresholds, blocks: list[BlockItem | None], tracker: _DuplicateTracker
+) -> None:
+    items = _handle_list_block(rb, thresholds)
+    if items:  # Only add if there are items
+        blocks.append(
+            ListBlock.model_construct(
+                items=items,
+                ordered=rb.ordered,
+                level=rb.level,
+                bbox=rb.bbox,
+            )
+        )
+
+
+_BlockHandler = Callable[[Any, _PageThresholds, list[BlockItem | None], _DuplicateTracker], None]
+
+# Exact type -> handler, so each raw block costs one dict lookup instead of a chain of isinstance checks.
+# Subclasses are resolved through their MRO on first sight and memoized; unknown block types are skipped.
+_BLOCK_HANDLERS: dict[type, _BlockHandler | None] = {
+    RawTextBlock: _add_text_block,
+    RawImageBlock: _add_image_block,
+    RawTableBlock: _add_table_block,
+    RawLinkBlock: _add_link_block,
+    RawListBlock: _add_list_block,
+}
+
+
+def _handler_for(block_type: type) -> _BlockHandler | None:
+    """Find the handler for a raw block type that is not registered directly."""
+    handler = next((_BLOCK_HANDLERS[cls] for cls in block_type.__mro__ if cls in _BLOCK_HANDLERS), None)
+    _BLOCK_HANDLERS[block_type] = handler
+    return handler
+
+
 def _process_blocks(
     raw_blocks: RawBlockArray,
-    metrics: PageMetrics,
+    thresholds: _PageThresholds,
     header_threshold: float,
     footer_threshold: float,
 ) -> list[BlockItem]:
-    """Process all raw blocks into parsed blocks."""
-    blocks: list[BlockItem] = []
+    """Process all raw blocks into parsed blocks.
+
+    Parsed blocks (and their spans) are built with `model_construct` throughout this module: every field is
+    derived from raw blocks that were already validated or built by our own extractor, so re-validating is
+    pure overhead.
+    """
+    # Superseded blocks are tombstoned (set to None) so indices in the tracker never need shifting
+    blocks: list[BlockItem | None] = []
     tracker = _DuplicateTracker()
 
     for rb in raw_blocks.blocks:
         # Skip header/footer regions
-        if rb.bbox[1] < header_threshold or rb.bbox[1] > footer_threshold:
+        if not header_threshold <= rb.bbox[1] <= footer_threshold:
             continue
 
-        match rb:
-            case RawTextBlock():
-                # Skip narrow blocks (likely sidebar remnants)
-                if rb.bbox[2] - rb.bbox[0] < 50:
-                    continue
-
-                for pb in _handle_text_block(rb, metrics):
-                    if _should_skip_paragraph(pb, tracker):
-                        continue
-
-                    normalized = " ".join(pb.text.lower().split())
-
-                    # Handle heading replacing non-heading duplicate
-                    if pb.heading > 0 and normalized in tracker.text_to_index:
-                        idx = tracker.text_to_index[normalized]
-                        if idx < len(blocks) and getattr(blocks[idx], "heading", 0) == 0:
-                            del blocks[idx]
-                            tracker.remove_at_index(idx)
-
-                    tracker.add(normalized, len(blocks))
-                    blocks.append(pb)
-
-            case RawImageBlock():
-                if tracker.is_image_duplicate(rb.src):
-                    continue
-                tracker.add_image(rb.src)
-                blocks.append(
-                    ImageBlock(
-                        src=rb.src,
-                        alt=rb.alt,
-                        dimensions=(round(rb.bbox[2] - rb.bbox[0]), round(rb.bbox[3] - rb.bbox[1])),
-                        bbox=rb.bbox,
-                    )
-                )
-
-            case RawTableBlock():
-                if tracker.is_table_duplicate(rb.rows):
-                    continue
-                tracker.add_table(rb.rows)
-                rb.rows = [
-                    [cell.replace("\n", " ").strip() for cell in row] for row in rb.rows
-                ]  # line breaks malform tables
-                blocks.append(
-                    TableBlock(
-                        rows=rb.rows,
-                        bbox=rb.bbox,
-                    )
-                )
-
-            case RawLinkBlock():
-                blocks.append(
-                    LinkBlock(
-                        href=rb.href,
-                        spans=rb.spans,
-                        bbox=rb.bbox,
-                    )
-                )
-
-            case RawListBlock():
-                items = _handle_list_block(rb, metrics)
-                if items:  # Only add if there are items
-                    blocks.append(
-                        ListBlock(
-                            items=items,
-                            ordered=rb.ordered,
-                            level=rb.level,
-                            bbox=rb.bbox,
-                        )
-                    )
+        block_type = type(rb)
+        handler = _BLOCK_HANDLERS[block_type] if block_type in _BLOCK_HANDLERS else _handler_for(block_type)
+        if handler is not None:
+            handler(rb, thresholds, blocks, tracker)
 
-            case RawBlock():
-                pass
-
-    return blocks
+    return [block for block in blocks if block is not None]
 
 
 @overload
@@ -382,18 +509,15 @@ def extract_blocks(
     # Reorder blocks by reading order
     raw_blocks = reading_order(raw_blocks)
     metrics = compute_page_metrics(raw_blocks)
+    thresholds = _compute_page_thresholds(metrics)
 
     # Calculate header/footer thresholds
-    if raw_blocks.blocks:
-        max_y = max((b.bbox[3] for b in raw_blocks.blocks), default=0)
-        header_threshold = max_y * config.header_threshold
-        footer_threshold = max_y * config.footer_threshold
-    else:
-        header_threshold = footer_threshold = 0
+    header_threshold = metrics.max_y * config.header_threshold
+    footer_threshold = metrics.max_y * config.footer_threshold
 
     # Process all blocks
-    blocks = _process_blocks(raw_blocks, metrics, header_threshold, footer_threshold)
+    blocks = _process_blocks(raw_blocks, thresholds, header_threshold, footer_threshold)
 
     filter_blocks(blocks)
 
-    return ParsedBlocks(url=raw_blocks.url, blocks=blocks)
+    return ParsedBlocks.model_construct(url=raw_blocks.url, blocks=blocks)
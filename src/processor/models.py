@@ -8,7 +8,8 @@ from src.common.utils.statistics import Statistics
 from src.common.models import BBox, Span
 
 from functools import cached_property
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
 from src.common.utils.logger import logger
 
 
@@ -88,104 +89,140 @@ class ParsedBlocks(BlockArray):
     C: access markdown representation via .markdown property
     """
 
-    def _format_spans(self, spans: list[Span]) -> str:
-        """Format a list of spans into markdown text with proper spacing."""
-        if not spans:
-            return ""
-
-        result = ""
-        for i, span in enumerate(spans):
-            text = span.text
-
-            # Apply formatting
-            for fmt in span.formats:
-                match fmt:
-                    case "bold":
-                        text = f"**{text}**"
-                    case "italic":
-                        text = f"*{text}*"
-                    case "code":
-                        text = f"`{text}`"
-                    case "none":
-                        pass
-                    case _:
-                        logger.warning(f"Unknown format: {fmt}")
-
-            # Add space before this span if needed
-            if i > 0 and result and not result[-1].isspace():
-                # Don't add space if current text starts with punctuation
-                if text and text[0] not in ".,!?;:)]}":
-                    result += " "
-
-            result += text
-
-        return result
-
     @cached_property
     def json(self) -> str:  # pyright: ignore[reportIncompatibleMethodOverride]
-        return self.model_dump_json()
+        # serialize_as_any: each block goes through its own subclass's compiled serializer in pydantic-core
+        # (so paragraph spans, table rows, etc. are kept), rather than the `BlockItem` schema of the field.
+        return self.model_dump_json(serialize_as_any=True)
 
     @cached_property
     def markdown(self) -> str:
         lines: list[str] = []
         for block in self.blocks:
-            if isinstance(block, ParagraphBlock):
-                if block.is_code:
-                    lines.append(f"```\n{block.text}\n```\n\n")
-                elif block.heading > 0:
-                    prefix = "#" * block.heading
-                    lines.append(f"{prefix} {block.text}\n\n")
-                else:
-                    span_md = self._format_spans(block.spans)
-                    lines.append(f"{span_md}\n\n")
-
-            elif isinstance(block, ImageBlock):
-                alt_text = block.alt if block.alt else "Image"
-                lines.append(f"![{alt_text}]({block.src}) {block.dimensions[0]}x{block.dimensions[1]}\n\n")
-
-            elif isinstance(block, TableBlock):
-                if not block.rows or len(block.rows) == 0:
-                    continue
-
-                # Find the maximum number of columns across all rows
-                max_cols = max(len(row) for row in block.rows)
-                if max_cols == 0:
-                    continue
-
-                # Normalize rows to have the same number of columns
-                normalized_rows: list[list[str]] = []
-                for row in block.rows:
-                    # Pad with empty strings if row is shorter
-                    normalized_row = row + [""] * (max_cols - len(row))
-                    normalized_rows.append(normalized_row)
-
-                # First row is header
-                header: list[str] = normalized_rows[0]
-                lines.append("| " + " | ".join(header) + " |\n")
-                lines.append("| " + " | ".join(["---"] * len(header)) + " |\n")
-
-                # Remaining rows are data
-                for row in normalized_rows[1:]:
-                    lines.append("| " + " | ".join(row) + " |\n")
-                lines.append("\n")  # blank line after table
-
-            elif isinstance(block, LinkBlock):
-                span_md = self._format_spans(block.spans)
-                lines.append(f"[{span_md}]({block.href})\n\n")
-
-            elif isinstance(block, ListBlock):
-                for i, item_spans in enumerate(block.items):
-                    item_text = self._format_spans(item_spans)
-                    prefix = "  " * block.level  # Indentation for nested lists
-                    if block.ordered:
-                        lines.append(f"{prefix}{i + 1}. {item_text}\n")
-                    else:
-                        lines.append(f"{prefix}- {item_text}\n")
-                lines.append("\n")  # blank line after list
-
+            # One dict lookup per block instead of an isinstance chain
+            block_type = type(block)
+            if block_type in _MARKDOWN_RENDERERS:
+                render = _MARKDOWN_RENDERERS[block_type]
+            else:
+                render = _renderer_for(block_type)
+            if render is not None:
+                render(block, lines)
         return "".join(lines)
 
 
+def _apply_formats(text: str, formats: Iterable[str]) -> str:
+    """Wrap text in the markdown markers of each of its formats."""
+    for fmt in formats:
+        match fmt:
+            case "bold":
+                text = f"**{text}**"
+            case "italic":
+                text = f"*{text}*"
+            case "code":
+                text = f"`{text}`"
+            case "none":
+                pass
+            case _:
+                logger.warning(f"Unknown format: {fmt}")
+    return text
+
+
+def _format_spans(spans: list[Span]) -> str:
+    """Format a list of spans into markdown text with proper spacing."""
+    if not spans:
+        return ""
+
+    parts: list[str] = []
+    last_char = ""  # last character emitted so far
+    for i, span in enumerate(spans):
+        text = _apply_formats(span.text, span.formats)
+
+        # Add space before this span if needed
+        if i > 0 and last_char and not last_char.isspace():
+            # Don't add space if current text starts with punctuation
+            if text and text[0] not in ".,!?;:)]}":
+                parts.append(" ")
+
+        if text:
+            parts.append(text)
+            last_char = text[-1]
+
+    return "".join(parts)
+
+
+def _paragraph_markdown(block: ParagraphBlock, lines: list[str]) -> None:
+    if block.is_code:
+        lines.append(f"```\n{block.text}\n```\n\n")
+    elif block.heading > 0:
+        prefix = "#" * block.heading
+        lines.append(f"{prefix} {block.text}\n\n")
+    else:
+        span_md = _format_spans(block.spans)
+        lines.append(f"{span_md}\n\n")
+
+
+def _image_markdown(block: ImageBlock, lines: list[str]) -> None:
+    alt_text = block.alt if block.alt else "Image"
+    lines.append(f"![{alt_text}]({block.src}) {block.dimensions[0]}x{block.dimensions[1]}\n\n")
+
+
+def _table_markdown(block: TableBlock, lines: list[str]) -> None:
+    if not block.rows or len(block.rows) == 0:
+        return
+
+    # Find the maximum number of columns across all rows
+    max_cols = max(len(row) for row in block.rows)
+    if max_cols == 0:
+        return
+
+    for r, row in enumerate(block.rows):
+        # Pad with empty strings if row is shorter; full-width rows are joined without copying
+        missing = max_cols - len(row)
+        cells = " | ".join(row + [""] * missing if missing else row)
+        lines.append(f"| {cells} |\n")
+        if r == 0:
+            # First row is header
+            lines.append("|" + " --- |" * max_cols + "\n")
+    lines.append("\n")  # blank line after table
+
+
+def _link_markdown(block: LinkBlock, lines: list[str]) -> None:
+    span_md = _format_spans(block.spans)
+    lines.append(f"[{span_md}]({block.href})\n\n")
+
+
+def _list_markdown(block: ListBlock, lines: list[str]) -> None:
+    prefix = "  " * block.level  # Indentation for nested lists
+    for i, item_spans in enumerate(block.items):
+        item_text = _format_spans(item_spans)
+        if block.ordered:
+            lines.append(f"{prefix}{i + 1}. {item_text}\n")
+        else:
+            lines.append(f"{prefix}- {item_text}\n")
+    lines.append("\n")  # blank line after list
+
+
+_MarkdownRenderer = Callable[[Any, list[str]], None]
+
+# Exact block type -> renderer appending that block's markdown to the output lines.
+# Subclasses are resolved through their MRO on first sight and memoized; unknown block types are skipped.
+_MARKDOWN_RENDERERS: dict[type, _MarkdownRenderer | None] = {
+    ParagraphBlock: _paragraph_markdown,
+    ImageBlock: _image_markdown,
+    TableBlock: _table_markdown,
+    LinkBlock: _link_markdown,
+    ListBlock: _list_markdown,
+}
+
+
+def _renderer_for(block_type: type) -> _MarkdownRenderer | None:
+    """Find the renderer for a block type that is not registered directly."""
+    render = next((_MARKDOWN_RENDERERS[c] for c in block_type.__mro__ if c in _MARKDOWN_RENDERERS), None)
+    _MARKDOWN_RENDERERS[block_type] = render
+    return render
+
+
 class PageMetrics(BaseModel):
     font_size: Statistics
     font_weight: Statistics
+    max_y: float = 0  # bottom edge of the lowest block
@@ -1,88 +1,100 @@
 """Post processing filters for blocks."""
 
 from src.processor.models import LinkBlock, BlockItem
+from functools import lru_cache
 from typing import Callable
-import pycountry
 from urllib.parse import urlparse
 from src.common.utils.logger import logger
 import unicodedata
 
-# Build ISO language codes set
-ISO_LANG_CODES: set[str] = set()
-for lang in pycountry.languages:
-    if hasattr(lang, "alpha_2"):
+
+@lru_cache(maxsize=4096)
+def ascii_fold(text: str) -> str:
+    """NFKD-normalize text and drop whatever is left outside ASCII (e.g. "Français" -> "Francais")."""
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+
+
+@lru_cache(maxsize=1)
+def _lang_tables() -> tuple[frozenset[str], frozenset[str]]:
+    """ISO 639-1 codes and language names (English, native and ASCII-folded), built on first use."""
+    import pycountry
+
+    iso_lang_codes: set[str] = set()
+    lang_names: set[str] = set()
+    for lang in pycountry.languages:
         alpha_2 = getattr(lang, "alpha_2", None)
         if isinstance(alpha_2, str):
-            ISO_LANG_CODES.add(alpha_2.lower())
+            iso_lang_codes.add(alpha_2.lower())
 
-# Build language names set (English + native names)
-LANG_NAMES: set[str] = set()
-for lang in pycountry.languages:
-    if hasattr(lang, "name"):
+        # English + native names
         name = getattr(lang, "name", None)
         if isinstance(name, str):
-            LANG_NAMES.add(name.lower())
-    if hasattr(lang, "native_name"):
+            lang_names.add(name.lower())
         native_name = getattr(lang, "native_name", None)
         if isinstance(native_name, str):
-            LANG_NAMES.add(native_name.lower())
+            lang_names.add(native_name.lower())
 
-LANG_NAMES.update({"Deutsch", "Espanol", "日本語"})  # last is JP
+    lang_names.update({"Deutsch", "Espanol", "日本語"})  # last is JP
+    lang_names.update([ascii_fold(name).strip().lower() for name in lang_names])
 
-for name in list(LANG_NAMES):
-    normalized_name = (
-        unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii").strip().lower()
-    )
-    LANG_NAMES.add(normalized_name)
+    return frozenset(iso_lang_codes), frozenset(lang_names)
 
 
 def is_lang_path_segment(segment: str) -> bool:
+    iso_lang_codes, _ = _lang_tables()
     segment = segment.lower()
     if "-" in segment:
         lang, _ = segment.split("-", 1)
-        return lang in ISO_LANG_CODES
-    return segment in ISO_LANG_CODES
+        return lang in iso_lang_codes
+    return segment in iso_lang_codes
+
+
+@lru_cache(maxsize=4096)
+def _first_path_segment(href: str) -> str | None:
+    """Lowercased, ASCII-folded first path segment of a URL, or None if its path is empty.
+
+    Memoized because the same navigation hrefs recur throughout a page and across pages.
+    """
+    path_segment = urlparse(href.lower()).path.strip("/").split("/")[0]
+    if not path_segment:
+        return None
+    return ascii_fold(path_segment).lower()
+
+
+def _is_language_link(block: BlockItem, lang_names: frozenset[str]) -> bool:
+    if not isinstance(block, LinkBlock):
+        return False
+
+    # Check first path segment
+    path_segment = _first_path_segment(block.href)
+    if path_segment is None:
+        return False
+
+    # Check if first segment is a language code
+    if is_lang_path_segment(path_segment):
+        return True
+
+    for span in block.spans:
+        # Link texts repeat heavily across a page (and across pages), so the fold is memoized
+        filtered = ascii_fold(span.text).strip().lower()
+        logger.info("possibly filtering out (language text): %s", filtered)
+        if (filtered or span.text) in lang_names:
+            logger.info("removing language link with text: %s", span.text)
+            return True
+
+    return False
 
 
 def remove_language_links(blocks: list[BlockItem]) -> None:
     """Remove blocks that are likely to be language selection links."""
-    for idx, block in reversed(list(enumerate(blocks))):
-        if not isinstance(block, LinkBlock):
-            continue
-
-        href = block.href.lower()
-        # Check first path segment
-        path_segment = urlparse(href).path.strip("/").split("/")[0]
-        if not path_segment:
-            continue
-
-        path_segment = (
-            unicodedata.normalize("NFKD", path_segment).encode("ascii", "ignore").decode("ascii").lower()
-        )
-
-        # Check if first segment is a language code
-        if is_lang_path_segment(path_segment):
-            del blocks[idx]
-            continue
-
-        for span in block.spans:
-            filtered = (
-                unicodedata.normalize("NFKD", span.text)
-                .encode("ascii", "ignore")
-                .decode("ascii")
-                .strip()
-                .lower()
-            )
-            logger.info("possibly filtering out (language text): %s", filtered)
-            if (filtered or span.text) in LANG_NAMES:
-                logger.info("removing language link with text: %s", span.text)
-                del blocks[idx]
-                break
+    _, lang_names = _lang_tables()
+    blocks[:] = [block for block in blocks if not _is_language_link(block, lang_names)]
 
 
-def ignore_common_bs(blocks: list[BlockItem]) -> None:
-    """Ignore blocks that are common boilerplate links."""
-    bs = [
+# Common boilerplate link texts, lowercased with spaces removed
+COMMON_BS: frozenset[str] = frozenset(
+    s.replace(" ", "").lower()
+    for s in (
         "privacy policy",
         "terms of service",
         "terms and conditions",
@@ -100,17 +112,20 @@ def ignore_common_bs(blocks: list[BlockItem]) -> None:
         "privacy & terms",
         "licenses",
         "your privacy choices",
-    ]
-    for i, s in enumerate(bs):
-        bs[i] = s.replace(" ", "").lower()
+    )
+)
+
+
+def _is_common_bs(block: BlockItem) -> bool:
+    if not isinstance(block, LinkBlock):
+        return False
+    link_text = "".join(span.text.strip().lower() for span in block.spans).replace(" ", "")
+    return link_text in COMMON_BS
 
-    for idx, block in reversed(list(enumerate(blocks))):
-        if not isinstance(block, LinkBlock):
-            continue
 
-        link_text = " ".join(span.text.strip().lower() for span in block.spans).replace(" ", "")
-        if link_text in bs:
-            del blocks[idx]
+def ignore_common_bs(blocks: list[BlockItem]) -> None:
+    """Ignore blocks that are common boilerplate links."""
+    blocks[:] = [block for block in blocks if not _is_common_bs(block)]
 
 
 def duped_links(blocks: list[BlockItem]) -> None:
@@ -2,68 +2,426 @@
 
 import streamlit as st
 import cProfile
-import pstats
+import importlib.util
+import io
+import uuid
+from typing import Any
+import numpy as np
 import pandas as pd
+from src.blocks import BlockArray, extract_raw_blocks
 from src.processor.core import extract_blocks
 
 st.set_page_config(page_title="Performance Profiler", layout="wide")
 
 st.title("🔍 Performance Profiler")
 
+ProfileColumns = dict[str, Any]
+
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def fetch_raw_blocks(url: str) -> BlockArray:
+    """Load and extract the page once per URL, so re-runs profile parsing without browser/network I/O."""
+    return extract_raw_blocks(url)
+
+
+def _code_label(code: Any) -> tuple[str, int, str]:
+    """(file, line, name) of a profiler entry, labelled the way pstats labels it."""
+    if isinstance(code, str):  # builtins carry a description instead of a code object
+        return ("~", 0, code)
+    return (code.co_filename, code.co_firstlineno, code.co_name)
+
+
+def profile_cprofile(raw_blocks: BlockArray) -> tuple[ProfileColumns, float, str]:
+    """Profile parsing with cProfile (deterministic: exact call counts, but per-call overhead)."""
+    # One profiler per session, cleared between runs rather than rebuilt.
+    # Caller/callee edges and C builtins are never shown, so don't record them.
+    if "profiler" not in st.session_state:
+        st.session_state.profiler = cProfile.Profile(subcalls=False, builtins=False)
+    profiler: cProfile.Profile = st.session_state.profiler
+    profiler.clear()
+    profiler.enable()
+    try:
+        result = extract_blocks(raw_blocks)
+    finally:
+        # A profiler left enabled would hold the interpreter-wide profiling hook and break every later run
+        profiler.disable()
+    # Only the type is reported; free the parsed page before the stats are post-processed
+    result_type = type(result).__name__
+    del result
+
+    # Raw entries straight from the C profiler; pstats would only copy them into another dict first
+    entries = profiler.getstats()
+    n = len(entries)
+    keys = [_code_label(e.code) for e in entries]
+    filenames, lines, func_names = map(list, zip(*keys, strict=True)) if keys else ([], [], [])
+    tottime = np.fromiter((e.inlinetime for e in entries), dtype=np.float64, count=n) * 1000
+
+    # Collect all functions column-wise (one array per column) rather than as a dict per function
+    columns: ProfileColumns = {
+        "filename": filenames,
+        "line": lines,
+        "function": func_names,
+        # Primitive (non-recursive) calls, as pstats reports them
+        "calls": np.fromiter((e.callcount - e.reccallcount for e in entries), dtype=np.int64, count=n),
+        "total_time_ms": tottime,
+        "cumulative_time_ms": np.fromiter((e.totaltime for e in entries), dtype=np.float64, count=n) * 1000,
+    }
+    return columns, float(tottime.sum()), result_type
+
+
+def profile_pyinstrument(raw_blocks: BlockArray) -> tuple[ProfileColumns, float, str]:
+    """Profile parsing with pyinstrument's 1 kHz sampler.
+
+    Sampling barely slows the code down, so short hot functions aren't inflated the way they are under
+    cProfile, but it cannot count calls: `calls` is always 0.
+    """
+    from pyinstrument import Profiler
+
+    profiler = Profiler(interval=0.001)
+    profiler.start()
+    try:
+        result = extract_blocks(raw_blocks)
+    finally:
+        profiler.stop()
+    result_type = type(result).__name__
+    del result
+
+    # Fold the call tree into one row per function: self time adds up across every node of the function,
+    # cumulative time only across nodes that are not nested inside another call of the same function.
+    totals: dict[tuple[str, int, str], list[float]] = {}  # key -> [self time, cumulative time]
+    root = profiler.last_session.root_frame()
+    no_active: frozenset[tuple[str, int, str]] = frozenset()
+    stack = [(root, no_active)] if root is not None else []
+    while stack:
+        frame, active = stack.pop()
+        key = (frame.file_path or "", frame.line_no or 0, frame.function or "")
+        entry = totals.setdefault(key, [0.0, 0.0])
+        entry[0] += frame.total_self_time
+        if key not in active:
+            entry[1] += frame.time
+        stack.extend((child, active | {key}) for child in frame.children if not child.is_synthetic)
+
+    keys = list(totals)
+    n = len(keys)
+    filenames, lines, func_names = map(list, zip(*keys, strict=True)) if keys else ([], [], [])
+    times = np.array(list(totals.values()), dtype=np.float64).reshape(n, 2) * 1000
+    columns: ProfileColumns = {
+        "filename": filenames,
+        "line": lines,
+        "function": func_names,
+        "calls": np.zeros(n, dtype=np.int64),
+        "total_time_ms": times[:, 0],
+        "cumulative_time_ms": times[:, 1],
+    }
+    return columns, (root.time if root is not None else 0.0) * 1000, result_type
+
+
+MAX_ROWS = 100  # upper bound of the "Max rows to display" slider
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def ranked(
+    profile_id: str,
+    _df: pd.DataFrame,
+    column: str,
+    min_time_ms: float,
+    src_only: bool = False,
+    limit: int | None = MAX_ROWS,
+) -> pd.DataFrame:
+    """Up to `limit` rows (all if None) of a profile's frame by descending `column`, memoized across reruns.
+
+    Only functions with at least `min_time_ms` cumulative time are kept. `_df` is left out of the cache key
+    (hashing it would cost about as much as the sort); `profile_id`, unique per profiling run, stands in for
+    it.
+    """
+    mask = _df["cumulative_time_ms"].to_numpy() >= min_time_ms
+    if src_only:
+        mask &= _df["is_src"].to_numpy()
+    df = _df[mask]
+    if limit is None:
+        return df.sort_values(column, ascending=False)
+    # Partial selection of the top rows instead of sorting the whole frame
+    return df.nlargest(limit, column)
+
+
+def top_by(
+    profile_id: str,
+    df: pd.DataFrame,
+    column: str,
+    max_rows: int | None,
+    min_time_ms: float,
+    src_only: bool = False,
+) -> pd.DataFrame:
+    """The top `max_rows` rows (all if None) by descending `column`.
+
+    Rankings are cached for the slider's whole range, so changing `max_rows` only slices a cached ranking.
+    """
+    if max_rows is None:
+        return ranked(profile_id, df, column, min_time_ms, src_only, limit=None)
+    return ranked(profile_id, df, column, min_time_ms, src_only).head(max_rows)
+
+
+def with_time_per_call(df: pd.DataFrame) -> pd.DataFrame:
+    """Add own time per call, derived only for the rows on screen rather than stored for every function."""
+    calls = df["calls"].to_numpy()
+    tottime = df["total_time_ms"].to_numpy(dtype=np.float64)
+    return df.assign(time_per_call_ms=np.divide(tottime, calls, out=np.zeros(len(df)), where=calls > 0))
+
+
+PROFILERS = {"cProfile": profile_cprofile}
+# pyinstrument is optional; only offer it where it's installed
+if importlib.util.find_spec("pyinstrument") is not None:
+    PROFILERS["pyinstrument"] = profile_pyinstrument
+
+
+@st.cache_data(persist="disk", show_spinner=False)
+def run_profile_cached(url: str, engine: str) -> dict[str, Any]:
+    """Profile parsing `url` and post-process the stats, persisted to disk so a page reload can resume it.
+
+    Exceptions aren't cached, so a failed run is retried next time.
+    """
+    raw_blocks = fetch_raw_blocks(url)
+    columns, total_time, result_type = PROFILERS[engine](raw_blocks)
+
+    # Build the frame and its derived columns once; every tab below slices this same frame. All functions are
+    # kept, so a new min-time cutoff re-filters it instead of needing a new profile.
+    df = pd.DataFrame(
+        {
+            **columns,
+            # Few distinct files/names repeat across many rows; categoricals store each once, and the .str
+            # derivations below then run once per category rather than per row
+            "filename": pd.Categorical(columns["filename"]),
+            "function": pd.Categorical(columns["function"]),
+            # Shown to at most 4 decimals of a millisecond, so float32 is plenty and halves what sorts touch
+            "total_time_ms": columns["total_time_ms"].astype(np.float32),
+            "cumulative_time_ms": columns["cumulative_time_ms"].astype(np.float32),
+        }
+    )
+    df["is_src"] = df["filename"].str.contains("src/", regex=False).astype(bool)
+    df["file"] = df["filename"].str.rsplit("/", n=1).str[-1]
+    # Path below src/ for project files, bare file name for everything else
+    df["src_file"] = df["file"].where(~df["is_src"], df["filename"].str.split("src/").str[-1])
+    df["location"] = df["file"] + ":" + df["line"].astype(str)
+    df["%_of_total"] = (df["total_time_ms"] / total_time * 100).round(1)
+
+    return {
+        "functions": df,
+        "total_time": total_time,
+        "success": True,
+        "profile_id": uuid.uuid4().hex,
+        "engine": engine,
+        "result_type": result_type,
+    }
+
+
+def load_profile(url: str, engine: str) -> None:
+    """Fetch (or run) the profile into the session, recording failures instead of raising."""
+    try:
+        st.session_state.profiler_data = run_profile_cached(url, engine)
+    except Exception as e:
+        st.session_state.profiler_data = {"success": False, "error": str(e)}
+        return
+    # Remember what was profiled in the page URL, so a browser refresh reloads it from the disk cache
+    st.query_params.update(url=url, engine=engine)
+
+
+@st.fragment
+def render_all_functions(df_all: pd.DataFrame, profile_id: str, max_rows: int, min_time_ms: float) -> None:
+    """All functions, by cumulative time."""
+    st.subheader("All Functions (sorted by cumulative time)")
+
+    df = with_time_per_call(top_by(profile_id, df_all, "cumulative_time_ms", max_rows, min_time_ms))
+
+    display_df = df[
+        [
+            "location",
+            "function",
+            "calls",
+            "total_time_ms",
+            "cumulative_time_ms",
+            "time_per_call_ms",
+            "%_of_total",
+        ]
+    ].copy()
+
+    display_df.columns = [
+        "Location",
+        "Function",
+        "Calls",
+        "Total Time (ms)",
+        "Cumulative Time (ms)",
+        "Time/Call (ms)",
+        "% of Total",
+    ]
+
+    st.dataframe(
+        display_df,
+        width="stretch",
+        hide_index=True,
+        column_config={
+            "Total Time (ms)": st.column_config.NumberColumn(format="%.2f"),
+            "Cumulative Time (ms)": st.column_config.NumberColumn(format="%.2f"),
+            "Time/Call (ms)": st.column_config.NumberColumn(format="%.4f"),
+        },
+    )
+
+
+@st.fragment
+def render_time_consumers(df_all: pd.DataFrame, profile_id: str, max_rows: int, min_time_ms: float) -> None:
+    """Top src/ functions by own time, with a bar chart."""
+    st.subheader("Top Time Consumers (by total time, excluding subcalls)")
+
+    df_src = top_by(profile_id, df_all, "total_time_ms", max_rows, min_time_ms, src_only=True)
+
+    if len(df_src) > 0:
+        display_df = df_src[["src_file", "function", "total_time_ms", "%_of_total", "calls"]].copy()
+
+        display_df.columns = ["File", "Function", "Total Time (ms)", "% of Total", "Calls"]
+
+        st.dataframe(
+            display_df,
+            width="stretch",
+            hide_index=True,
+            column_config={
+                "Total Time (ms)": st.column_config.ProgressColumn(
+                    format="%.2f",
+                    min_value=0,
+                    max_value=float(df_src["total_time_ms"].max()),
+                ),
+            },
+        )
+
+        # Bar chart
+        chart_df = df_src.head(15)[["function", "total_time_ms"]].copy()
+        chart_df.columns = ["Function", "Time (ms)"]
+        st.bar_chart(chart_df.set_index("Function"))
+    else:
+        st.info("No functions from src/ directory found")
+
+
+@st.fragment
+def render_most_called(
+    df_all: pd.DataFrame, profile_id: str, max_rows: int, min_time_ms: float, engine: str
+) -> None:
+    """Most frequently called src/ functions."""
+    st.subheader("Most Frequently Called Functions")
+
+    df_src = top_by(profile_id, df_all, "calls", max_rows, min_time_ms, src_only=True)
+    df_src = with_time_per_call(df_src)
+
+    if engine != "cProfile":
+        st.info("Call counts are only recorded by cProfile")
+    elif len(df_src) > 0:
+        display_df = df_src[["src_file", "function", "calls", "time_per_call_ms", "total_time_ms"]].copy()
+
+        display_df.columns = ["File", "Function", "Calls", "Time/Call (ms)", "Total Time (ms)"]
+
+        st.dataframe(
+            display_df,
+            width="stretch",
+            hide_index=True,
+            column_config={
+                "Calls": st.column_config.NumberColumn(format="%d"),
+                "Time/Call (ms)": st.column_config.NumberColumn(format="%.4f"),
+                "Total Time (ms)": st.column_config.NumberColumn(format="%.2f"),
+            },
+        )
+
+        # Highlight hot loops (counted from the mask; the matching rows themselves aren't needed)
+        hot_mask = (df_src["calls"].to_numpy() > 100) & (df_src["total_time_ms"].to_numpy() > 50)
+        n_hot = int(hot_mask.sum())
+        if n_hot:
+            st.warning(f"⚠️ Found {n_hot} potential hot loops (>100 calls, >50ms total)")
+    else:
+        st.info("No functions from src/ directory found")
+
+
+@st.fragment
+def render_code_only(df_all: pd.DataFrame, profile_id: str, max_rows: int, min_time_ms: float) -> None:
+    """Every src/ function, with CSV download."""
+    st.subheader("Functions from src/ Directory")
+
+    df_src = top_by(profile_id, df_all, "cumulative_time_ms", None, min_time_ms, src_only=True)
+
+    if len(df_src) > 0:
+        display_df = df_src[
+            [
+                "src_file",
+                "line",
+                "function",
+                "calls",
+                "total_time_ms",
+                "cumulative_time_ms",
+                "%_of_total",
+            ]
+        ].copy()
+
+        display_df.columns = [
+            "File",
+            "Line",
+            "Function",
+            "Calls",
+            "Total Time (ms)",
+            "Cumulative Time (ms)",
+            "% of Total",
+        ]
+
+        st.dataframe(
+            display_df,
+            width="stretch",
+            hide_index=True,
+            height=600,
+            column_config={
+                "Total Time (ms)": st.column_config.NumberColumn(format="%.2f"),
+                "Cumulative Time (ms)": st.column_config.NumberColumn(format="%.2f"),
+            },
+        )
+
+        # Download button
+        # Written in chunks straight into a byte buffer rather than built up as one Python string
+        csv = io.BytesIO()
+        display_df.to_csv(csv, index=False, chunksize=1024)
+        st.download_button(
+            label="📥 Download as CSV",
+            data=csv.getvalue(),
+            file_name="profile_results.csv",
+            mime="text/csv",
+        )
+    else:
+        st.info("No functions from src/ directory found")
+
+
+# Pre-fill the controls with the last profiled URL/engine, if the page URL carries them
+last_engine = st.query_params.get("engine")
+
 # Sidebar controls
 with st.sidebar:
     st.header("Configuration")
-    test_url = st.text_input("Test URL", value="https://example.com")
+    test_url = st.text_input("Test URL", value=st.query_params.get("url", "https://example.com"))
+    engine = st.radio(
+        "Profiler",
+        list(PROFILERS),
+        index=list(PROFILERS).index(last_engine) if last_engine in PROFILERS else 0,
+        horizontal=True,
+        help="cProfile counts every call; pyinstrument samples, which skews short functions less.",
+    )
     min_time_ms = st.slider("Min time to show (ms)", 1, 100, 10)
-    max_rows = st.slider("Max rows to display", 10, 100, 30)
+    max_rows = st.slider("Max rows to display", 10, MAX_ROWS, 30)
 
     run_profile = st.button("▶️ Run Profile", type="primary", use_container_width=True)
 
 if "profiler_data" not in st.session_state:
     st.session_state.profiler_data = None
+    # Fresh session (e.g. after a refresh): resume the last profile from the disk cache
+    if "url" in st.query_params and last_engine in PROFILERS:
+        with st.spinner("Loading previous profile..."):
+            load_profile(st.query_params["url"], last_engine)
 
 if run_profile:
     with st.spinner("Running profiler..."):
-        profiler = cProfile.Profile()
-
-        try:
-            profiler.enable()
-            result = extract_blocks(test_url)
-            profiler.disable()
-
-            stats = pstats.Stats(profiler)
-
-            # Collect all functions
-            all_functions = []
-            for func_key, data in stats.stats.items():
-                filename, line, func_name = func_key
-                ncalls = data[0]
-                tottime = data[2] * 1000
-                cumtime = data[3] * 1000
-
-                if cumtime >= min_time_ms:
-                    all_functions.append(
-                        {
-                            "filename": filename,
-                            "line": line,
-                            "function": func_name,
-                            "calls": ncalls,
-                            "total_time_ms": tottime,
-                            "cumulative_time_ms": cumtime,
-                            "time_per_call_ms": tottime / ncalls if ncalls > 0 else 0,
-                            "is_src": "src/" in filename,
-                        }
-                    )
-
-            st.session_state.profiler_data = {
-                "functions": all_functions,
-                "total_time": stats.total_tt * 1000,
-                "success": True,
-                "result_type": str(type(result)),
-            }
-
-        except Exception as e:
-            st.session_state.profiler_data = {"success": False, "error": str(e)}
+        # An explicit run always re-profiles, replacing any persisted result for this URL and engine
+        run_profile_cached.clear(test_url, engine)
+        load_profile(test_url, engine)
 
 # Display results
 if st.session_state.profiler_data:
@@ -73,15 +431,18 @@ if st.session_state.profiler_data:
         st.error(f"❌ Profiling failed: {data['error']}")
     else:
         st.success("✅ Profiling completed successfully")
+        df_all: pd.DataFrame = data["functions"]
+        profile_id: str = data["profile_id"]
+        shown = df_all["cumulative_time_ms"].to_numpy() >= min_time_ms
 
         # Summary metrics
         col1, col2, col3 = st.columns(3)
         with col1:
             st.metric("Total Execution Time", f"{data['total_time']:.2f} ms")
         with col2:
-            st.metric("Functions Analyzed", len(data["functions"]))
+            st.metric("Functions Analyzed", int(shown.sum()))
         with col3:
-            src_funcs = sum(1 for f in data["functions"] if f["is_src"])
+            src_funcs = int((shown & df_all["is_src"].to_numpy()).sum())
             st.metric("Your Code Functions", src_funcs)
 
         st.divider()
@@ -89,168 +450,18 @@ if st.session_state.profiler_data:
         # Create tabs
         tab1, tab2, tab3, tab4 = st.tabs(["All Functions", "Time Consumers", "Most Called", "Code Only"])
 
-        # Tab 1: All functions
+        # Each tab is a fragment, so interacting with one tab reruns only that tab
         with tab1:
-            st.subheader("All Functions (sorted by cumulative time)")
-
-            df = pd.DataFrame(data["functions"])
-            df = df.sort_values("cumulative_time_ms", ascending=False).head(max_rows)
-
-            # Format the dataframe
-            df["file"] = df["filename"].apply(lambda x: x.split("/")[-1])
-            df["location"] = df["file"] + ":" + df["line"].astype(str)
-            df["%_of_total"] = (df["total_time_ms"] / data["total_time"] * 100).round(1)
-
-            display_df = df[
-                [
-                    "location",
-                    "function",
-                    "calls",
-                    "total_time_ms",
-                    "cumulative_time_ms",
-                    "time_per_call_ms",
-                    "%_of_total",
-                ]
-            ].copy()
-
-            display_df.columns = [
-                "Location",
-                "Function",
-                "Calls",
-                "Total Time (ms)",
-                "Cumulative Time (ms)",
-                "Time/Call (ms)",
-                "% of Total",
-            ]
+            render_all_functions(df_all, profile_id, max_rows, min_time_ms)
 
-            st.dataframe(
-                display_df,
-                width="stretch",
-                hide_index=True,
-                column_config={
-                    "Total Time (ms)": st.column_config.NumberColumn(format="%.2f"),
-                    "Cumulative Time (ms)": st.column_config.NumberColumn(format="%.2f"),
-                    "Time/Call (ms)": st.column_config.NumberColumn(format="%.4f"),
-                },
-            )
-
-        # Tab 2: Time consumers
         with tab2:
-            st.subheader("Top Time Consumers (by total time, excluding subcalls)")
-
-            df = pd.DataFrame(data["functions"])
-            df_src = df[df["is_src"]].copy()
-            df_src = df_src.sort_values("total_time_ms", ascending=False).head(max_rows)
-
-            if len(df_src) > 0:
-                df_src["file"] = df_src["filename"].apply(
-                    lambda x: x.split("src/")[-1] if "src/" in x else x.split("/")[-1]
-                )
-                df_src["%_of_total"] = (df_src["total_time_ms"] / data["total_time"] * 100).round(1)
-
-                display_df = df_src[["file", "function", "total_time_ms", "%_of_total", "calls"]].copy()
-
-                display_df.columns = ["File", "Function", "Total Time (ms)", "% of Total", "Calls"]
-
-                st.dataframe(
-                    display_df,
-                    width="stretch",
-                    hide_index=True,
-                    column_config={
-                        "Total Time (ms)": st.column_config.ProgressColumn(
-                            format="%.2f",
-                            min_value=0,
-                            max_value=float(df_src["total_time_ms"].max()),
-                        ),
-                    },
-                )
-
-                # Bar chart
-                chart_df = df_src.head(15)[["function", "total_time_ms"]].copy()
-                chart_df.columns = ["Function", "Time (ms)"]
-                st.bar_chart(chart_df.set_index("Function"))
-            else:
-                st.info("No functions from src/ directory found")
-
-        # Tab 3: Most called
+            render_time_consumers(df_all, profile_id, max_rows, min_time_ms)
+
         with tab3:
-            st.subheader("Most Frequently Called Functions")
-
-            df = pd.DataFrame(data["functions"])
-            df_src = df[df["is_src"]].copy()
-            df_src = df_src.sort_values("calls", ascending=False).head(max_rows)
-
-            if len(df_src) > 0:
-                df_src["file"] = df_src["filename"].apply(
-                    lambda x: x.split("src/")[-1] if "src/" in x else x.split("/")[-1]
-                )
-
-                display_df = df_src[["file", "function", "calls", "time_per_call_ms", "total_time_ms"]].copy()
-
-                display_df.columns = ["File", "Function", "Calls", "Time/Call (ms)", "Total Time (ms)"]
-
-                st.dataframe(
-                    display_df,
-                    width="stretch",
-                    hide_index=True,
-                    column_config={
-                        "Calls": st.column_config.NumberColumn(format="%d"),
-                        "Time/Call (ms)": st.column_config.NumberColumn(format="%.4f"),
-                        "Total Time (ms)": st.column_config.NumberColumn(format="%.2f"),
-                    },
-                )
-
-                # Highlight hot loops
-                hot_loops = df_src[(df_src["calls"] > 100) & (df_src["total_time_ms"] > 50)]
-                if len(hot_loops) > 0:
-                    st.warning(f"⚠️ Found {len(hot_loops)} potential hot loops (>100 calls, >50ms total)")
-            else:
-                st.info("No functions from src/ directory found")
-
-        # Tab 4: Your code only
+            render_most_called(df_all, profile_id, max_rows, min_time_ms, data["engine"])
+
         with tab4:
-            st.subheader("Functions from src/ Directory")
-
-            df = pd.DataFrame(data["functions"])
-            df_src = df[df["is_src"]].copy()
-            df_src = df_src.sort_values("cumulative_time_ms", ascending=False)
-
-            if len(df_src) > 0:
-                df_src["file"] = df_src["filename"].apply(lambda x: x.split("src/")[-1])
-                df_src["%_of_total"] = (df_src["total_time_ms"] / data["total_time"] * 100).round(1)
-
-                display_df = df_src[
-                    ["file", "line", "function", "calls", "total_time_ms", "cumulative_time_ms", "%_of_total"]
-                ].copy()
-
-                display_df.columns = [
-                    "File",
-                    "Line",
-                    "Function",
-                    "Calls",
-                    "Total Time (ms)",
-                    "Cumulative Time (ms)",
-                    "% of Total",
-                ]
-
-                st.dataframe(
-                    display_df,
-                    width="stretch",
-                    hide_index=True,
-                    height=600,
-                    column_config={
-                        "Total Time (ms)": st.column_config.NumberColumn(format="%.2f"),
-                        "Cumulative Time (ms)": st.column_config.NumberColumn(format="%.2f"),
-                    },
-                )
-
-                # Download button
-                csv = display_df.to_csv(index=False)
-                st.download_button(
-                    label="📥 Download as CSV", data=csv, file_name="profile_results.csv", mime="text/csv"
-                )
-            else:
-                st.info("No functions from src/ directory found")
+            render_code_only(df_all, profile_id, max_rows, min_time_ms)
 
 else:
     st.info("Configure settings and click 'Run Profile' to start")